@@ -6,73 +6,203 @@ Consolidates source code into type-specific .txt files with high-visibility AI m
 
 import os
 import sys
+import time
+import shutil
 import argparse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+# Files larger than this are streamed to the group file in chunks of this size
+COPY_CHUNK_SIZE = 1 << 20
+# Write buffer for each open group file
+OUTPUT_BUFFER_SIZE = 1 << 20
+# Reader threads, and how many files they may load ahead of the writer
+READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+READ_AHEAD = READ_WORKERS * 2
+# Per-file progress lines are flushed to stdout in batches of this many, or this often
+LOG_FLUSH_LINES = 256
+LOG_FLUSH_SECONDS = 0.1
+
+def _scan_dir(path):
+    """Returns the entries of one directory sorted by name, or [] if it cannot be read."""
+    try:
+        with os.scandir(path) as it:
+            # normcase matches Path ordering, which ignores case on Windows
+            return sorted(it, key=lambda e: os.path.normcase(e.name))
+    except OSError:
+        return []
+
+def scan_tree(root, exclude_dirs):
+    """
+    Returns a DirEntry for every non-directory under root, skipping exclude_dirs.
+    DirEntry carries the file type from the directory read, so no extra lstat is needed.
+    Each directory's entries are sorted by name, so files come out in path order.
+    Uses an explicit stack rather than recursion, so deep trees cannot hit the recursion limit.
+    """
+    files = []
+    # Reversed so that pop() hands entries back in name order
+    stack = _scan_dir(root)[::-1]
+    while stack:
+        entry = stack.pop()
+        if entry.is_dir():
+            if entry.name not in exclude_dirs and not entry.is_symlink():
+                stack.extend(reversed(_scan_dir(entry.path)))
+        else:
+            files.append(entry)
+    return tuple(files)
+
 class AIOptimizedGroupedConverter:
     def __init__(self, source_folder, output_dir):
         self.source_folder = Path(source_folder)
         self.output_dir = Path(output_dir)
-        self.extensions = ['.html', '.json', '.js', '.css', '.yml', '.yaml', '.ts', '.py', '.md']
-        self.exclude_dirs = ['node_modules', '.git', 'dist', 'build', 'coverage', '.qodo']
+        # Sets, since both are checked once per directory entry
+        self.extensions = frozenset(['.html', '.json', '.js', '.css', '.yml', '.yaml', '.ts', '.py', '.md'])
+        self.exclude_dirs = frozenset(['node_modules', '.git', 'dist', 'build', 'coverage', '.qodo'])
+        # Extension -> group key (e.g. '.js' -> 'js'): one lookup both filters and classifies a file
+        self._ext_groups = {ext: ext.replace('.', '') for ext in self.extensions}
         self.stats = {"converted": 0, "groups": {}}
+        # Group files are written as bytes; the marker rules are encoded once here
+        self._begin_rule = b'=' * 80
+        self._end_rule = b'#' * 80
+        self._log_buf = []
+        self._log_flushed_at = time.monotonic()
+
+    def log(self, line):
+        """Buffers a progress line, writing the batch out every LOG_FLUSH_LINES lines or LOG_FLUSH_SECONDS."""
+        self._log_buf.append(line)
+        if len(self._log_buf) >= LOG_FLUSH_LINES or time.monotonic() - self._log_flushed_at >= LOG_FLUSH_SECONDS:
+            self.flush_log()
+
+    def flush_log(self):
+        if self._log_buf:
+            sys.stdout.write('\n'.join(self._log_buf) + '\n')
+            self._log_buf.clear()
+        self._log_flushed_at = time.monotonic()
 
-    def format_ai_separator(self, file_path):
+    def format_ai_separator(self, rel_path, st):
         """
         Creates a high-contrast separator for AI processing.
         Includes full path and metadata for context grounding.
+        `st` is the file's os.stat_result, taken once by the caller.
         """
-        rel_path = file_path.relative_to(self.source_folder)
-        return (
-            f"\n{'=' * 80}\n"
-            f"FILE_BEGIN: {rel_path}\n"
-            f"METADATA: Size={file_path.stat().st_size} bytes | Last_Modified={datetime.fromtimestamp(file_path.stat().st_mtime)}\n"
-            f"{'=' * 80}\n"
+        return b"\n%b\nFILE_BEGIN: %b\nMETADATA: Size=%d bytes | Last_Modified=%b\n%b\n" % (
+            self._begin_rule,
+            rel_path.encode('utf-8'),
+            st.st_size,
+            str(datetime.fromtimestamp(st.st_mtime)).encode('utf-8'),
+            self._begin_rule,
         )
 
-    def format_eof_marker(self, file_path):
+    def format_eof_marker(self, rel_path):
         """Adds a clear boundary marker for the end of the file content."""
-        rel_path = file_path.relative_to(self.source_folder)
-        return f"\n\n[FILE_END: {rel_path}]\n{'#' * 80}\n"
+        return b"\n\n[FILE_END: %b]\n%b\n" % (rel_path.encode('utf-8'), self._end_rule)
+
+    def read_head(self, src):
+        """
+        Reads the start of a large file, continuing past whitespace-only chunks
+        so blank files can still be skipped without loading them whole.
+        """
+        head = src.read(COPY_CHUNK_SIZE)
+        while head and not head.strip():
+            chunk = src.read(COPY_CHUNK_SIZE)
+            if not chunk:
+                break
+            head += chunk
+        return head
+
+    def load_file(self, entry):
+        """
+        Opens, stats and reads one source file; runs on a reader thread.
+        Returns (stat, content, src). Small files are read whole and src is None;
+        for large files content is only the head and src is left open for streaming.
+        The stat is taken from the open file, so the header matches the bytes written,
+        and it is the only stat made per file.
+        """
+        # Content is copied through verbatim, so it is never decoded
+        src = open(entry.path, 'rb')
+        try:
+            st = os.fstat(src.fileno())
+            if st.st_size == 0:
+                # Nothing to read; the caller skips empty content
+                src.close()
+                return st, b'', None
+            if st.st_size <= COPY_CHUNK_SIZE:
+                with src:
+                    return st, src.read(), None
+            return st, self.read_head(src), src
+        except BaseException:
+            src.close()
+            raise
 
     def process_files(self):
         self.output_dir.mkdir(parents=True, exist_ok=True)
         all_files = []
-        for root, dirs, files in os.walk(self.source_folder):
-            dirs[:] = [d for d in dirs if d not in self.exclude_dirs]
-            for f in files:
-                all_files.append(Path(root) / f)
-        
-        all_files.sort()
-
-        for f_path in all_files:
-            if f_path.suffix.lower() not in self.extensions:
-                continue
-
-            # Group by extension: e.g., js_logic.txt, html_logic.txt
-            ext_key = f_path.suffix.lower().replace('.', '')
-            output_file = self.output_dir / f"{ext_key}_logic_group.txt"
-            
-            try:
-                with open(f_path, 'r', encoding='utf-8', errors='ignore') as src:
-                    content = src.read()
-                
-                if not content.strip():
-                    continue
-
-                with open(output_file, 'a', encoding='utf-8') as out:
-                    # Write high-visibility BEGIN marker
-                    out.write(self.format_ai_separator(f_path))
-                    out.write(content)
-                    # Write clear EOF marker
-                    out.write(self.format_eof_marker(f_path))
-
-                self.stats['converted'] += 1
-                self.stats['groups'][ext_key] = self.stats['groups'].get(ext_key, 0) + 1
-                print(f"[OK] {f_path.name} appended to {output_file.name}")
-            except Exception as e:
-                print(f"[ERR] {f_path.name}: {e}")
+        # Every entry path starts with the source folder, so the relative path is a slice
+        prefix_len = len(os.path.join(self.source_folder, ''))
+        for entry in scan_tree(self.source_folder, self.exclude_dirs):
+            ext_key = self._ext_groups.get(os.path.splitext(entry.name)[1].lower())
+            if ext_key is not None:
+                all_files.append((entry.path[prefix_len:], ext_key, entry))
+
+        # Reader threads load files ahead of the writer; results are consumed
+        # in sorted order so only this thread ever touches the group files.
+        pending = deque()
+        queued = iter(all_files)
+
+        def submit_next(pool):
+            item = next(queued, None)
+            if item is not None:
+                pending.append((item, pool.submit(self.load_file, item[2])))
+
+        # One open handle per group file, kept for the whole run
+        handles = {}
+        try:
+            with ThreadPoolExecutor(max_workers=READ_WORKERS) as pool:
+                for _ in range(READ_AHEAD):
+                    submit_next(pool)
+
+                while pending:
+                    (rel_path, ext_key, entry), future = pending.popleft()
+                    submit_next(pool)
+
+                    # Group by extension: e.g., js_logic.txt, html_logic.txt
+                    output_file = self.output_dir / f"{ext_key}_logic_group.txt"
+
+                    try:
+                        st, content, src = future.result()
+                        try:
+                            if not content.strip():
+                                continue
+
+                            out = handles.get(ext_key)
+                            if out is None:
+                                out = handles[ext_key] = open(output_file, 'ab', buffering=OUTPUT_BUFFER_SIZE)
+
+                            separator = self.format_ai_separator(rel_path, st)
+                            eof_marker = self.format_eof_marker(rel_path)
+                            if src is not None:
+                                # Copy the rest of a large file chunk by chunk instead of holding it in memory
+                                out.write(separator + content)
+                                shutil.copyfileobj(src, out, COPY_CHUNK_SIZE)
+                                out.write(eof_marker)
+                            else:
+                                # High-visibility BEGIN marker, content and EOF marker in one write
+                                out.write(b"".join((separator, content, eof_marker)))
+                        finally:
+                            if src is not None:
+                                src.close()
+
+                        self.stats['converted'] += 1
+                        self.stats['groups'][ext_key] = self.stats['groups'].get(ext_key, 0) + 1
+                        self.log(f"[OK] {entry.name} appended to {output_file.name}")
+                    except Exception as e:
+                        self.log(f"[ERR] {entry.name}: {e}")
+        finally:
+            for out in handles.values():
+                out.close()
+            self.flush_log()
 
     def run(self):
         print(f"Exporting AI-ready groups from: {self.source_folder}")